@@ -3,6 +3,7 @@ from __future__ import annotations
 from importlib.metadata import version
 
 from import_analyzer._autofix import remove_unused_imports
+from import_analyzer._cross_file import CrossFileAnalyzer
 from import_analyzer._cross_file import CrossFileResult
 from import_analyzer._cross_file import analyze_cross_file
 from import_analyzer._data import ImplicitReexport
@@ -39,6 +40,7 @@ __all__ = [
     "ImportGraph",
     "build_import_graph",
     "build_import_graph_from_directory",
+    "CrossFileAnalyzer",
     "analyze_cross_file",
     "check_cross_file",
     # CLI
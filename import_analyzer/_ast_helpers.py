@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import ast
+import sys
 from dataclasses import dataclass
 from dataclasses import field
 from enum import Enum
@@ -506,7 +507,11 @@ class ScopeAwareNameCollector(ast.NodeVisitor):
 
 
 class ImportExtractor(ast.NodeVisitor):
-    """Extract all imports from an AST."""
+    """Extract all imports from an AST.
+
+    Names are interned: the same few names (os, Path, List, ...) are imported
+    across many files and compared in sets throughout cross-file analysis.
+    """
 
     def __init__(self) -> None:
         self.imports: list[ImportInfo] = []
@@ -520,6 +525,7 @@ class ImportExtractor(ast.NodeVisitor):
             else:
                 # Only the top-level name is bound
                 name = alias.name.split(".")[0]
+            name = sys.intern(name)
 
             # Use alias's lineno for multi-line imports (Python 3.10+)
             # This ensures noqa comments on specific lines are respected
@@ -528,7 +534,7 @@ class ImportExtractor(ast.NodeVisitor):
                 ImportInfo(
                     name=name,
                     module="",
-                    original_name=alias.name,
+                    original_name=sys.intern(alias.name),
                     lineno=alias_lineno,
                     col_offset=node.col_offset,
                     end_lineno=node.end_lineno or node.lineno,
@@ -542,7 +548,7 @@ class ImportExtractor(ast.NodeVisitor):
         self.generic_visit(node)
 
     def visit_FromImport(self, node: ast.ImportFrom) -> None:
-        module = node.module or ""
+        module = sys.intern(node.module or "")
 
         # Skip __future__ imports - they have side effects and are never "unused"
         if module == "__future__":
@@ -553,7 +559,7 @@ class ImportExtractor(ast.NodeVisitor):
                 # Star imports can't be analyzed for unused names
                 continue
 
-            name = alias.asname if alias.asname else alias.name
+            name = sys.intern(alias.asname if alias.asname else alias.name)
             # Use alias's lineno for multi-line imports (Python 3.10+)
             # This ensures noqa comments on specific lines are respected
             alias_lineno = getattr(alias, "lineno", node.lineno)
@@ -561,7 +567,7 @@ class ImportExtractor(ast.NodeVisitor):
                 ImportInfo(
                     name=name,
                     module=module,
-                    original_name=alias.name,
+                    original_name=sys.intern(alias.name),
                     lineno=alias_lineno,
                     col_offset=node.col_offset,
                     end_lineno=node.end_lineno or node.lineno,
@@ -806,6 +812,6 @@ def _extract_string_list(node: ast.expr) -> set[str]:
     if isinstance(node, (ast.List, ast.Tuple)):
         for elt in node.elts:
             if isinstance(elt, ast.Constant) and isinstance(elt.value, str):
-                names.add(elt.value)
+                names.add(sys.intern(elt.value))
 
     return names
@@ -0,0 +1,97 @@
+"""On-disk cache of single-file analysis results, keyed by file content."""
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from functools import lru_cache
+from importlib.metadata import version
+from pathlib import Path
+from typing import Any
+
+from import_analyzer import _ast_helpers
+from import_analyzer import _data
+from import_analyzer import _detection
+from import_analyzer._data import ImportInfo
+
+# Default cache location, relative to the working directory
+DEFAULT_CACHE_DIR = Path(".import_analyzer_cache")
+
+
+@lru_cache(maxsize=None)
+def _cache_salt() -> bytes:
+    """Salt mixed into every cache key.
+
+    Includes the analyzer and Python versions, since either can change the
+    results for the same source, and a digest of the modules that compute
+    the results, so editable installs don't reuse entries across edits.
+    """
+    python_version = ".".join(str(part) for part in sys.version_info[:2])
+    digest = hashlib.blake2b(
+        f"{version('import-analyzer-py')}:{python_version}".encode(),
+        digest_size=16,
+    )
+    for module in (_ast_helpers, _data, _detection):
+        if module.__file__ is not None:
+            digest.update(Path(module.__file__).read_bytes())
+    return digest.digest()
+
+
+def cache_key(data: bytes) -> str:
+    """Compute the cache key for a file's raw contents."""
+    digest = hashlib.blake2b(_cache_salt(), digest_size=16)
+    digest.update(data)
+    return digest.hexdigest()
+
+
+def _entry_path(cache_dir: Path, key: str) -> Path:
+    return cache_dir / key[:2] / key[2:]
+
+
+def cache_get(cache_dir: Path, key: str) -> list[ImportInfo] | None:
+    """Load cached unused imports for a key, or None on a cache miss.
+
+    Unreadable or corrupt entries are treated as misses.
+    """
+    try:
+        raw = json.loads(_entry_path(cache_dir, key).read_text(encoding="utf-8"))
+        return [_load_import_info(fields) for fields in raw]
+    except (OSError, LookupError, ValueError, TypeError):
+        return None
+
+
+def _load_import_info(fields: dict[str, Any]) -> ImportInfo:
+    # Intern names like ImportExtractor does for freshly parsed files
+    for key in ("name", "module", "original_name"):
+        fields[key] = sys.intern(fields[key])
+    return ImportInfo(**fields)
+
+
+def cache_put(cache_dir: Path, key: str, unused: list[ImportInfo]) -> None:
+    """Store unused imports for a key.
+
+    The entry is written to a temporary file and renamed into place, so
+    concurrent readers never see a partial entry. Failures are ignored: the
+    cache is only an optimization.
+    """
+    entry = _entry_path(cache_dir, key)
+    try:
+        if not cache_dir.is_dir():
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            # Keep the cache out of version control
+            (cache_dir / ".gitignore").write_text("*\n", encoding="utf-8")
+        entry.parent.mkdir(exist_ok=True)
+
+        fd, tmp_name = tempfile.mkstemp(dir=entry.parent)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump([dataclasses.asdict(imp) for imp in unused], f)
+            os.replace(tmp_name, entry)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except OSError:
+        pass
@@ -3,27 +3,41 @@
 from __future__ import annotations
 
 import ast
+import os
+import sys
 from collections import defaultdict
+from collections import deque
+from collections.abc import Iterable
 from dataclasses import dataclass
 from dataclasses import field
+from functools import partial
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from import_analyzer._ast_helpers import AttributeAccessCollector
+from import_analyzer._ast_helpers import AttributeUsage
 from import_analyzer._ast_helpers import ImportExtractor
 from import_analyzer._ast_helpers import collect_dunder_all_names
+from import_analyzer._cache import cache_get
+from import_analyzer._cache import cache_key
+from import_analyzer._cache import cache_put
 from import_analyzer._data import ImplicitReexport
 from import_analyzer._data import ImportEdge
 from import_analyzer._data import ImportInfo
 from import_analyzer._data import IndirectAttributeAccess
 from import_analyzer._data import IndirectImport
 from import_analyzer._data import ModuleInfo
+from import_analyzer._data import sorted_names
 from import_analyzer._detection import find_unused_imports
 from import_analyzer._graph import DefinitionCollector
 from import_analyzer._graph import ImportGraph
 from import_analyzer._resolution import ModuleResolver
 
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class CrossFileResult:
     """Results of cross-file import analysis."""
 
@@ -49,18 +63,197 @@ class CrossFileResult:
     unreachable_files: set[Path] = field(default_factory=set)
 
 
+# ProcessPoolExecutor rejects more workers than this on Windows
+_WINDOWS_MAX_PROCESS_WORKERS = 61
+
+# Binary mode matters on Windows, where os.open defaults to text mode
+_READ_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+
+
+def _read_bytes(file_path: Path) -> bytes:
+    """Read a file's raw contents using unbuffered OS-level reads.
+
+    Avoids the buffered-IO layer of Path.read_bytes() for the many small
+    files read during analysis.
+    """
+    fd = os.open(file_path, _READ_FLAGS)
+    try:
+        chunks: list[bytes] = []
+        while chunk := os.read(fd, 1 << 16):
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return b"".join(chunks)
+
+
+def _analyze_one(
+    file_path: Path,
+    cache_dir: Path | None = None,
+) -> tuple[Path, list[ImportInfo]]:
+    """Run single-file unused detection on one file.
+
+    Module-level (and returning only picklable values) so that it can be
+    dispatched to a process pool. If cache_dir is given, results are looked
+    up and stored there by content hash.
+    """
+    try:
+        data = _read_bytes(file_path)
+    except OSError:
+        return file_path, []
+
+    # A file without the "import" keyword can't have unused imports, so
+    # skip decoding and parsing it entirely
+    if b"import" not in data:
+        return file_path, []
+
+    key = cache_key(data) if cache_dir is not None else ""
+    if cache_dir is not None:
+        cached = cache_get(cache_dir, key)
+        if cached is not None:
+            return file_path, cached
+
+    try:
+        source = data.decode("utf-8")
+    except UnicodeDecodeError:
+        return file_path, []
+
+    unused = find_unused_imports(source)
+    if cache_dir is not None:
+        cache_put(cache_dir, key, unused)
+
+    return file_path, unused
+
+
+def _gil_enabled() -> bool:
+    """Check if the GIL is enabled (False on free-threaded builds, PEP 703)."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is None or bool(is_gil_enabled())
+
+
 class CrossFileAnalyzer:
-    """Analyze imports across multiple files."""
+    """Analyze imports across multiple files.
+
+    The analyzer can be kept around and analyze() called repeatedly (e.g. in
+    watch mode): per-file results are memoized, so later runs only redo the
+    graph-wide steps. Call invalidate() for files that changed in between.
+    """
 
     def __init__(
         self,
         graph: ImportGraph,
         entry_point: Path | None = None,
         include_same_package_indirect: bool = False,
+        jobs: int | None = 1,
+        cache_dir: Path | None = None,
     ) -> None:
         self.graph = graph
         self.entry_point = entry_point
         self.include_same_package_indirect = include_same_package_indirect
+        # Number of workers for per-file analysis (None = one per CPU)
+        self.jobs = jobs if jobs is not None else (os.cpu_count() or 1)
+        # Directory for the on-disk per-file result cache (None = disabled)
+        self.cache_dir = cache_dir
+
+        # Modules loaded only to resolve module.attr accesses (see
+        # _add_attr_module). They're kept out of the caller's graph, so the
+        # other steps never see them and repeated analyze() calls agree with
+        # a fresh analyzer on the same graph.
+        self._attr_modules: dict[Path, ModuleInfo] = {}
+
+        # Edge indices, built once and shared by all analysis steps
+        self._external_edges: list[ImportEdge] = []
+        self._internal_by_imported: dict[Path, list[ImportEdge]] = defaultdict(list)
+        self._by_importer: dict[Path, list[ImportEdge]] = defaultdict(list)
+        # imported file -> name -> files importing that name from it
+        self._used_by_index: defaultdict[Path, defaultdict[str, set[Path]]] = (
+            defaultdict(lambda: defaultdict(set))
+        )
+        for edge in graph.edges:
+            self._index_edge(edge)
+
+        # Memoized per-file results, dropped by invalidate()
+        self._unused_by_file: dict[Path, list[ImportInfo]] = {}
+        self._unused_without_all: dict[Path, set[str]] = {}
+        self._attr_usages: dict[Path, dict[str, list[AttributeUsage]]] = {}
+
+    def invalidate(self, paths: Iterable[Path]) -> None:
+        """Forget everything derived from the given files.
+
+        Call this after the files changed on disk. If their imports changed
+        too, update the graph first (ImportGraph.remove_imports() and
+        add_edge()): the files' edges are re-indexed from the graph here.
+        Modules loaded for attribute resolution are dropped and re-read when
+        needed again.
+        """
+        dirty = set(paths)
+        if not dirty:
+            return
+
+        for file_path in dirty:
+            self._unused_by_file.pop(file_path, None)
+            self._unused_without_all.pop(file_path, None)
+            self._attr_usages.pop(file_path, None)
+            for edge in self._by_importer.pop(file_path, ()):
+                self._unindex_edge(edge)
+            self._attr_modules.pop(file_path, None)
+
+        self._external_edges = [
+            edge for edge in self._external_edges if edge.importer not in dirty
+        ]
+        for file_path in dirty:
+            for edge in self.graph.get_imports(file_path):
+                self._index_edge(edge)
+
+    def _index_edge(self, edge: ImportEdge) -> None:
+        """Add an edge to the analyzer's edge indices."""
+        self._by_importer[edge.importer].append(edge)
+        if edge.importer in self._attr_modules:
+            # Only needed to resolve attribute accesses
+            return
+        if edge.is_external:
+            self._external_edges.append(edge)
+        elif edge.imported is not None:
+            self._internal_by_imported[edge.imported].append(edge)
+            used_by_name = self._used_by_index[edge.imported]
+            for name in edge.names:
+                used_by_name[name].add(edge.importer)
+
+    def _unindex_edge(self, edge: ImportEdge) -> None:
+        """Remove an internal edge from the imported-side indices.
+
+        External edges and _by_importer are handled by invalidate(), which
+        drops all of an importer's edges at once.
+        """
+        if edge.importer in self._attr_modules:
+            return
+        if edge.is_external or edge.imported is None:
+            return
+        self._internal_by_imported[edge.imported].remove(edge)
+        used_by_name = self._used_by_index[edge.imported]
+        for name in edge.names:
+            used_by_name[name].discard(edge.importer)
+            if not used_by_name[name]:
+                del used_by_name[name]
+
+    def _module_info(self, file_path: Path) -> ModuleInfo | None:
+        """Look up a module in the graph or among the attribute-only modules."""
+        module_info = self.graph.nodes.get(file_path)
+        if module_info is None:
+            module_info = self._attr_modules.get(file_path)
+        return module_info
+
+    def _has_module(self, file_path: Path) -> bool:
+        return file_path in self.graph.nodes or file_path in self._attr_modules
+
+    def module_names(self) -> dict[Path, str]:
+        """Module names of all known files, including attribute-only modules."""
+        names = {
+            file_path: module_info.module_name
+            for file_path, module_info in self._attr_modules.items()
+        }
+        for file_path, module_info in self.graph.nodes.items():
+            names[file_path] = module_info.module_name
+        return names
 
     def analyze(self) -> CrossFileResult:
         """Run cross-file analysis.
@@ -84,7 +277,11 @@ class CrossFileAnalyzer:
         are never flagged as unused. This matches the behavior of other linters
         like flake8, ruff, and autoflake.
         """
-        result = CrossFileResult()
+        # Attribute-only modules the caller has since added to the graph are
+        # project files now: index them from the graph instead
+        shadowed = [p for p in self._attr_modules if p in self.graph.nodes]
+        if shadowed:
+            self.invalidate(shadowed)
 
         # Step 1: Get single-file unused imports for each module
         single_file_unused = self._get_single_file_unused()
@@ -94,43 +291,16 @@ class CrossFileAnalyzer:
             single_file_unused,
         )
 
-        # Step 3: Compute full cascade of unused imports
-        all_removed: dict[Path, set[str]] = defaultdict(set)
-        unreachable_files: set[Path] = set()
-
-        changed = True
-        while changed:
-            changed = False
-
-            # Update file reachability based on removed imports
-            if self.entry_point:
-                unreachable_files = self._find_unreachable_files(all_removed)
-
-            # Find re-exports, excluding unreachable files as consumers
-            reexported = self._find_reexported_imports(
-                removed_imports=all_removed,
-                unreachable_files=unreachable_files,
-            )
+        # Import graph SCCs, shared by the cascade and cycle detection
+        sccs = self.graph.strongly_connected_components()
 
-            # Check imports that are unused locally
-            for file_path, unused in single_file_unused.items():
-                reexported_names = reexported.get(file_path, set())
-                for imp in unused:
-                    if imp.name not in reexported_names:
-                        if imp.name not in all_removed[file_path]:
-                            all_removed[file_path].add(imp.name)
-                            changed = True
-
-            # Check "implicit-reexport-only" imports (__init__.py without __all__)
-            for file_path, implicit_imports in implicit_reexport_only.items():
-                reexported_names = reexported.get(file_path, set())
-                for imp in implicit_imports:
-                    if imp.name not in reexported_names:
-                        if imp.name not in all_removed[file_path]:
-                            all_removed[file_path].add(imp.name)
-                            changed = True
+        # Step 3: Compute full cascade of unused imports
+        all_removed, unreachable_files = self._compute_cascade(
+            single_file_unused, implicit_reexport_only, sccs,
+        )
 
         # Build unused_imports from the stable removed set
+        unused_by_file: dict[Path, list[ImportInfo]] = {}
         for file_path, removed_names in all_removed.items():
             unused_imports: list[ImportInfo] = []
 
@@ -147,52 +317,215 @@ class CrossFileAnalyzer:
             if unused_imports:
                 # Sort by line number for consistent output
                 unused_imports.sort(key=lambda x: (x.lineno, x.name))
-                result.unused_imports[file_path] = unused_imports
+                unused_by_file[file_path] = unused_imports
 
         # Step 5: Find implicit re-exports (using final reexported state)
         final_reexported = self._find_reexported_imports(
             removed_imports=all_removed,
             unreachable_files=unreachable_files,
         )
-        result.implicit_reexports = self._find_implicit_reexports(final_reexported)
+        implicit_reexports = self._find_implicit_reexports(final_reexported)
 
         # Step 6: Aggregate external usage
-        result.external_usage = self._aggregate_external_usage()
+        external_usage = self._aggregate_external_usage()
 
         # Step 7: Find circular imports
-        result.circular_imports = self.graph.find_cycles()
+        circular_imports = self.graph.find_cycles(sccs=sccs)
 
         # Step 8: Store truly unreachable files for user warning
         # Filter to only files that are truly dead code (no reachable ancestors)
         truly_unreachable = self._filter_truly_unreachable(
             unreachable_files, all_removed,
         )
-        result.unreachable_files = truly_unreachable - {self.entry_point}
 
         # Step 9: Find indirect imports (imports through re-exporters)
-        result.indirect_imports = self._find_indirect_imports()
+        indirect_imports = self._find_indirect_imports()
 
         # Step 10: Find indirect attribute accesses (module.attr through re-exporters)
-        result.indirect_attr_accesses = self._find_indirect_attr_accesses()
+        indirect_attr_accesses = self._find_indirect_attr_accesses()
+
+        return CrossFileResult(
+            unused_imports=unused_by_file,
+            implicit_reexports=implicit_reexports,
+            indirect_imports=indirect_imports,
+            indirect_attr_accesses=indirect_attr_accesses,
+            external_usage=external_usage,
+            circular_imports=circular_imports,
+            unreachable_files=truly_unreachable - {self.entry_point},
+        )
 
-        return result
+    def _compute_cascade(
+        self,
+        single_file_unused: dict[Path, list[ImportInfo]],
+        implicit_reexport_only: dict[Path, list[ImportInfo]],
+        sccs: list[list[Path]],
+    ) -> tuple[dict[Path, set[str]], set[Path]]:
+        """Compute the full cascade of unused imports.
 
-    def _get_single_file_unused(self) -> dict[Path, list[ImportInfo]]:
-        """Run single-file unused detection on each module."""
-        result: dict[Path, list[ImportInfo]] = {}
+        Works through a queue of (file, name) candidates. A candidate is
+        removed once no reachable importer still imports the name from that
+        file. Removing it may leave the name without consumers in the files it
+        was imported from, so only those are queued for re-evaluation.
 
-        for file_path, module_info in self.graph.nodes.items():
-            try:
-                source = file_path.read_text(encoding="utf-8")
-            except (OSError, UnicodeDecodeError):
+        Returns:
+            Tuple of (removed import names per file, unreachable files).
+        """
+        all_removed: dict[Path, set[str]] = defaultdict(set)
+        unreachable_files: set[Path] = set()
+
+        candidates: dict[Path, set[str]] = defaultdict(set)
+        worklist: deque[tuple[Path, str]] = deque()
+        queued: set[tuple[Path, str]] = set()
+
+        def enqueue(file_path: Path, name: str) -> None:
+            item = (file_path, name)
+            if item in queued or name not in candidates.get(file_path, ()):
+                return
+            if name in all_removed.get(file_path, ()):
+                return
+            queued.add(item)
+            worklist.append(item)
+
+        for candidate_imports in (single_file_unused, implicit_reexport_only):
+            for file_path, imports in candidate_imports.items():
+                candidates[file_path].update(imp.name for imp in imports)
+
+        if self.entry_point:
+            unreachable_files = self._find_unreachable_files(all_removed)
+
+        # Only candidates can be removed, so with none there is no cascade
+        if not any(candidates.values()):
+            return all_removed, unreachable_files
+
+        # Seed importers before the files they import from (the SCCs come
+        # dependencies first, so walk them in reverse). A consumer's removal
+        # is then usually known before its upstream candidates are checked,
+        # so acyclic chains settle without re-evaluating anything.
+        for scc in reversed(sccs):
+            for file_path in scc:
+                for name in sorted(candidates.get(file_path, ())):
+                    enqueue(file_path, name)
+
+        while worklist:
+            while worklist:
+                item = worklist.popleft()
+                queued.discard(item)
+                file_path, name = item
+
+                if self._is_reexported(
+                    file_path, name, all_removed, unreachable_files,
+                ):
+                    continue
+
+                all_removed[file_path].add(name)
+
+                # The files this name was imported from may have lost
+                # their last consumer of it
+                for edge in self._by_importer.get(file_path, ()):
+                    if edge.imported is not None and name in edge.names:
+                        enqueue(edge.imported, name)
+
+            # Removed imports may cut files off from the entry point, and
+            # imports in unreachable files no longer count as consumers
+            if self.entry_point:
+                new_unreachable = self._find_unreachable_files(all_removed)
+                for file_path in new_unreachable - unreachable_files:
+                    for edge in self._by_importer.get(file_path, ()):
+                        if edge.imported is None:
+                            continue
+                        for name in edge.names:
+                            enqueue(edge.imported, name)
+                unreachable_files = new_unreachable
+
+        return all_removed, unreachable_files
+
+    def _is_reexported(
+        self,
+        file_path: Path,
+        name: str,
+        removed_imports: dict[Path, set[str]],
+        unreachable_files: set[Path],
+    ) -> bool:
+        """Check if an import in file_path is still imported by another file.
+
+        Importers that are unreachable, or whose own import of the name is
+        in removed_imports, don't count as consumers.
+        """
+        module_info = self.graph.nodes.get(file_path)
+        if module_info is None:
+            return False
+
+        # A name defined in the file is not a re-export of the import
+        if module_info.has_defined(name):
+            return False
+
+        for edge in self._internal_by_imported.get(file_path, ()):
+            if edge.importer in unreachable_files:
+                continue
+            if name not in edge.names:
                 continue
+            if name not in removed_imports.get(edge.importer, ()):
+                return True
+
+        return False
+
+    def _get_single_file_unused(self) -> dict[Path, list[ImportInfo]]:
+        """Run single-file unused detection on each module.
+
+        Each file is analyzed independently, so with more than one job the
+        files are spread across a process pool (the AST work is CPU-bound
+        and would otherwise serialize on the GIL).
+        """
+        file_paths = [
+            file_path for file_path in self.graph.nodes
+            if file_path not in self._unused_by_file
+        ]
+        analyze_one = partial(_analyze_one, cache_dir=self.cache_dir)
+
+        if self.jobs <= 1 or len(file_paths) <= 1:
+            analyzed = [analyze_one(file_path) for file_path in file_paths]
+        else:
+            with self._make_executor() as executor:
+                analyzed = list(
+                    executor.map(analyze_one, file_paths, chunksize=16),
+                )
+
+        for file_path, unused in analyzed:
+            self._unused_by_file[file_path] = unused
 
-            unused = find_unused_imports(source)
+        result: dict[Path, list[ImportInfo]] = {}
+        for file_path in self.graph.nodes:
+            unused = self._unused_by_file[file_path]
             if unused:
                 result[file_path] = unused
 
         return result
 
+    def _make_executor(self) -> Executor:
+        """Create the executor used for per-file analysis.
+
+        Uses threads on free-threaded builds (no GIL to serialize on, and no
+        pickling of results), and on platforms where process pools are
+        unavailable (e.g. no working multiprocessing synchronization
+        primitives).
+        """
+        # Imported lazily: concurrent.futures.process pulls in multiprocessing,
+        # which is pure startup cost for serial and single-file runs
+        from concurrent.futures import ProcessPoolExecutor
+        from concurrent.futures import ThreadPoolExecutor
+
+        if not _gil_enabled():
+            return ThreadPoolExecutor(max_workers=self.jobs)
+
+        max_workers = self.jobs
+        if sys.platform == "win32":
+            max_workers = min(max_workers, _WINDOWS_MAX_PROCESS_WORKERS)
+
+        try:
+            return ProcessPoolExecutor(max_workers=max_workers)
+        except (NotImplementedError, OSError):
+            return ThreadPoolExecutor(max_workers=self.jobs)
+
     def _get_implicit_reexport_only_imports(
         self,
         single_file_unused: dict[Path, list[ImportInfo]],
@@ -216,27 +549,24 @@ class CrossFileAnalyzer:
             if module_info.exports:  # Has __all__
                 continue
 
-            try:
-                source = file_path.read_text(encoding="utf-8")
-            except (OSError, UnicodeDecodeError):
-                continue
-
             # Get import names and their ImportInfo objects
             import_by_name = {imp.name: imp for imp in module_info.imports}
-            defined_names = module_info.defined_names
 
             # Names already flagged as unused locally
             unused_locally = {imp.name for imp in single_file_unused.get(file_path, [])}
 
             # Find candidates: is an import, not defined, not already unused
-            candidates = set(import_by_name.keys()) - defined_names - unused_locally
+            candidates = {
+                name
+                for name in import_by_name
+                if not module_info.has_defined(name)
+            } - unused_locally
 
             if not candidates:
                 continue
 
             # Check which candidates are actually used locally
-            unused_without_all = find_unused_imports(source, ignore_all=True)
-            unused_without_all_names = {imp.name for imp in unused_without_all}
+            unused_without_all_names = self._get_unused_without_all(file_path)
 
             # Implicit-reexport-only: would be unused if we checked locally
             implicit_reexport_names = candidates & unused_without_all_names
@@ -252,6 +582,20 @@ class CrossFileAnalyzer:
 
         return result
 
+    def _get_unused_without_all(self, file_path: Path) -> set[str]:
+        """Names of a file's imports that are unused when ignoring __all__."""
+        names = self._unused_without_all.get(file_path)
+        if names is None:
+            try:
+                source = file_path.read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError):
+                names = set()
+            else:
+                unused = find_unused_imports(source, ignore_all=True)
+                names = {imp.name for imp in unused}
+            self._unused_without_all[file_path] = names
+        return names
+
     def _find_unreachable_files(
         self,
         removed_imports: dict[Path, set[str]],
@@ -267,20 +611,10 @@ class CrossFileAnalyzer:
         if not self.entry_point:
             return set()
 
-        # Build set of excluded edges
-        excluded_edges: set[tuple[Path, str]] = set()
-
-        for edge in self.graph.edges:
-            if edge.is_external or edge.imported is None:
-                continue
-
-            removed_names = removed_imports.get(edge.importer, set())
-            # If all imported names are removed, the edge is removed
-            if edge.names and edge.names <= removed_names:
-                excluded_edges.add((edge.importer, edge.module_name))
-
         # Find reachable files
-        reachable = self.graph.find_reachable_files(self.entry_point, excluded_edges)
+        reachable = self.graph.find_reachable_files(
+            self.entry_point, self._find_excluded_edges(removed_imports),
+        )
 
         # Return unreachable files (for cascade detection)
         return set(self.graph.nodes.keys()) - reachable
@@ -304,15 +638,9 @@ class CrossFileAnalyzer:
             return set()
 
         # Recompute reachable files for ancestor checking
-        excluded_edges: set[tuple[Path, str]] = set()
-        for edge in self.graph.edges:
-            if edge.is_external or edge.imported is None:
-                continue
-            removed_names = removed_imports.get(edge.importer, set())
-            if edge.names and edge.names <= removed_names:
-                excluded_edges.add((edge.importer, edge.module_name))
-
-        reachable = self.graph.find_reachable_files(self.entry_point, excluded_edges)
+        reachable = self.graph.find_reachable_files(
+            self.entry_point, self._find_excluded_edges(removed_imports),
+        )
 
         # Filter to only files with no reachable ancestors
         truly_unreachable: set[Path] = set()
@@ -322,6 +650,25 @@ class CrossFileAnalyzer:
 
         return truly_unreachable
 
+    def _find_excluded_edges(
+        self,
+        removed_imports: dict[Path, set[str]],
+    ) -> set[tuple[Path, str]]:
+        """Find local import edges removed along with the removed imports.
+
+        An edge is considered removed when ALL names from that import are removed.
+        """
+        excluded_edges: set[tuple[Path, str]] = set()
+
+        for importer, removed_names in removed_imports.items():
+            for edge in self._by_importer.get(importer, ()):
+                if edge.is_external or edge.imported is None:
+                    continue
+                if edge.names and edge.names <= removed_names:
+                    excluded_edges.add((edge.importer, edge.module_name))
+
+        return excluded_edges
+
     def _has_reachable_ancestor(self, file_path: Path, reachable: set[Path]) -> bool:
         """Check if any ancestor package of file_path is in the reachable set."""
         # Walk up the directory tree looking for __init__.py files
@@ -351,47 +698,59 @@ class CrossFileAnalyzer:
         Returns a mapping of file -> set of import names that are used
         by other files importing from this file.
         """
+        reexported: dict[Path, set[str]] = {}
+
+        for imported_file in self._internal_by_imported:
+            names = self._find_reexported_names(
+                imported_file, removed_imports, unreachable_files,
+            )
+            if names:
+                reexported[imported_file] = names
+
+        return reexported
+
+    def _find_reexported_names(
+        self,
+        imported_file: Path,
+        removed_imports: dict[Path, set[str]] | None = None,
+        unreachable_files: set[Path] | None = None,
+    ) -> set[str]:
+        """Find the import names in one file that other files import from it.
+
+        See _find_reexported_imports() for the meaning of the arguments.
+        """
         removed = removed_imports or {}
         unreachable = unreachable_files or set()
-        reexported: dict[Path, set[str]] = defaultdict(set)
+        reexported: set[str] = set()
 
-        for edge in self.graph.edges:
-            if edge.is_external or edge.imported is None:
-                continue
+        module_info = self.graph.nodes.get(imported_file)
+        if module_info is None:
+            return reexported
+
+        # Check which imported names are actually import statements
+        # in the imported file (not defined there)
+        import_names_in_file = module_info.import_name_set
 
+        for edge in self._internal_by_imported.get(imported_file, ()):
             # Skip if the importer is unreachable (its imports don't count)
             if edge.importer in unreachable:
                 continue
 
-            # edge.imported is being imported by edge.importer
-            # edge.names are the names being imported
-            imported_file = edge.imported
-            imported_names = edge.names
-
             # Filter out names that are "virtually removed" from the importer
-            importer_removed = removed.get(edge.importer, set())
-            active_names = imported_names - importer_removed
-
-            if not active_names:
-                continue
-
-            if imported_file not in self.graph.nodes:
-                continue
-
-            module_info = self.graph.nodes[imported_file]
-
-            # Check which imported names are actually import statements
-            # in the imported file (not defined there)
-            import_names_in_file = {imp.name for imp in module_info.imports}
-            defined_in_file = module_info.defined_names
+            # (only build a new set when some of the edge's names are removed)
+            importer_removed = removed.get(edge.importer)
+            if importer_removed and not importer_removed.isdisjoint(edge.names):
+                active_names = edge.names - importer_removed
+            else:
+                active_names = edge.names
 
             for name in active_names:
                 # If the name is an import in the target file (not defined),
                 # then it's being re-exported
-                if name in import_names_in_file and name not in defined_in_file:
-                    reexported[imported_file].add(name)
+                if name in import_names_in_file and not module_info.has_defined(name):
+                    reexported.add(name)
 
-        return dict(reexported)
+        return reexported
 
     def _find_implicit_reexports(
         self,
@@ -405,16 +764,13 @@ class CrossFileAnalyzer:
                 continue
 
             module_info = self.graph.nodes[file_path]
-            exports = module_info.exports  # Names in __all__
+            used_by_name: dict[str, set[Path]] = self._used_by_index.get(file_path, {})
 
             for name in reexported_names:
                 # If re-exported but not in __all__, it's implicit
-                if name not in exports:
+                if not module_info.is_exported(name):
                     # Find which files use this re-exported name
-                    used_by: set[Path] = set()
-                    for edge in self.graph.get_importers(file_path):
-                        if name in edge.names:
-                            used_by.add(edge.importer)
+                    used_by = set(used_by_name.get(name, ()))
 
                     result.append(
                         ImplicitReexport(
@@ -428,13 +784,14 @@ class CrossFileAnalyzer:
 
     def _aggregate_external_usage(self) -> dict[str, set[Path]]:
         """Aggregate which files use which external modules."""
-        usage: dict[str, set[Path]] = defaultdict(set)
+        usage: defaultdict[str, set[Path]] = defaultdict(set)
 
-        for edge in self.graph.edges:
-            if edge.is_external:
-                usage[edge.module_name].add(edge.importer)
+        for edge in self._external_edges:
+            usage[edge.module_name].add(edge.importer)
 
-        return dict(usage)
+        # Behave like a plain dict (no auto-inserted keys) without copying
+        usage.default_factory = None
+        return usage
 
     def _find_indirect_imports(self) -> list[IndirectImport]:
         """Find imports that go through re-exporters instead of direct sources.
@@ -475,7 +832,7 @@ class CrossFileAnalyzer:
                 name_in_module = local_to_original.get(local_name, local_name)
 
                 # Check if this name is a re-export (import, not definition)
-                if name_in_module in imported_module.defined_names:
+                if imported_module.has_defined(name_in_module):
                     continue  # Defined here, not indirect
 
                 # Find where this module got the name from (and original name)
@@ -520,6 +877,7 @@ class CrossFileAnalyzer:
         self,
         file: Path,
         name: str,
+        include_attr_modules: bool = False,
     ) -> tuple[Path, str] | None:
         """Trace an import back to its original definition.
 
@@ -530,6 +888,9 @@ class CrossFileAnalyzer:
             Tuple of (source_file, original_name) where original_name is the
             name as defined in source_file (may differ from input name if
             aliases were used in the chain). Returns None if can't trace.
+
+            include_attr_modules also follows modules loaded for attribute
+            resolution, which only attribute access detection should see.
         """
         visited: set[Path] = set()
         current = file
@@ -537,12 +898,15 @@ class CrossFileAnalyzer:
 
         while current not in visited:
             visited.add(current)
-            module = self.graph.nodes.get(current)
+            if include_attr_modules:
+                module = self._module_info(current)
+            else:
+                module = self.graph.nodes.get(current)
             if not module:
                 return None
 
             # If defined here, this is the source
-            if current_name in module.defined_names:
+            if module.has_defined(current_name):
                 return (current, current_name)
 
             # Find where this module imports the name from
@@ -552,7 +916,7 @@ class CrossFileAnalyzer:
                     # Follow the original_name if aliased
                     next_name = imp.original_name
                     # Find the edge for this import
-                    for edge in self.graph.get_imports(current):
+                    for edge in self._by_importer.get(current, ()):
                         if current_name in edge.names and edge.imported:
                             current = edge.imported
                             current_name = next_name
@@ -602,9 +966,7 @@ class CrossFileAnalyzer:
         """
         results: list[IndirectAttributeAccess] = []
 
-        # Iterate over a copy of the keys since we may add new nodes during iteration
-        for file_path in list(self.graph.nodes.keys()):
-            module_info = self.graph.nodes[file_path]
+        for file_path, module_info in self.graph.nodes.items():
             # Find 'import X' or 'import X as Y' style imports
             # imp.name = bound name (alias if present), imp.original_name = actual module
             module_imports: dict[str, ImportInfo] = {}
@@ -615,18 +977,9 @@ class CrossFileAnalyzer:
             if not module_imports:
                 continue
 
-            # Parse file and collect attribute usages
-            try:
-                source = file_path.read_text(encoding="utf-8")
-                tree = ast.parse(source)
-            except (OSError, SyntaxError, UnicodeDecodeError):
-                continue
-
-            collector = AttributeAccessCollector(set(module_imports.keys()))
-            collector.visit(tree)
-
             # For each root import and its usages
-            for bound_name, usages in collector.usages.items():
+            attr_usages = self._get_attr_usages(file_path, set(module_imports))
+            for bound_name, usages in attr_usages.items():
                 if not usages:
                     continue
 
@@ -634,7 +987,7 @@ class CrossFileAnalyzer:
 
                 # Find the resolved module file for the root import
                 root_module_path: Path | None = None
-                for edge in self.graph.get_imports(file_path):
+                for edge in self._by_importer.get(file_path, ()):
                     if edge.module_name == imp.original_name and edge.imported:
                         root_module_path = edge.imported
                         break
@@ -695,6 +1048,24 @@ class CrossFileAnalyzer:
         results.sort(key=lambda x: (x.file, x.import_lineno, tuple(x.attr_path)))
         return results
 
+    def _get_attr_usages(
+        self, file_path: Path, module_imports: set[str],
+    ) -> dict[str, list[AttributeUsage]]:
+        """Collect module.attr usages of a file's 'import X' names."""
+        usages = self._attr_usages.get(file_path)
+        if usages is None:
+            try:
+                source = file_path.read_text(encoding="utf-8")
+                tree = ast.parse(source)
+            except (OSError, SyntaxError, UnicodeDecodeError):
+                usages = {}
+            else:
+                collector = AttributeAccessCollector(module_imports)
+                collector.visit(tree)
+                usages = collector.usages
+            self._attr_usages[file_path] = usages
+        return usages
+
     def _resolve_attr_path(
         self,
         start_module: Path,
@@ -717,7 +1088,7 @@ class CrossFileAnalyzer:
             return None
 
         current_module = start_module
-        current_module_info = self.graph.nodes.get(current_module)
+        current_module_info = self._module_info(current_module)
         if not current_module_info:
             return None
 
@@ -727,7 +1098,7 @@ class CrossFileAnalyzer:
             if next_module is None:
                 return None
             current_module = next_module
-            current_module_info = self.graph.nodes.get(current_module)
+            current_module_info = self._module_info(current_module)
             if not current_module_info:
                 return None
 
@@ -735,12 +1106,14 @@ class CrossFileAnalyzer:
         final_attr = attr_path[-1]
 
         # Is it defined in the current module?
-        if final_attr in current_module_info.defined_names:
+        if current_module_info.has_defined(final_attr):
             # Direct access - return current module as both final and original
             return (current_module, final_attr, current_module, final_attr)
 
         # Try to trace to original source
-        trace_result = self._trace_import_source(current_module, final_attr)
+        trace_result = self._trace_import_source(
+            current_module, final_attr, include_attr_modules=True,
+        )
         if trace_result is None:
             return None
 
@@ -756,7 +1129,7 @@ class CrossFileAnalyzer:
 
         Returns the resolved module path or None.
         """
-        module_info = self.graph.nodes.get(module_path)
+        module_info = self._module_info(module_path)
         if not module_info:
             return None
 
@@ -772,25 +1145,25 @@ class CrossFileAnalyzer:
 
         # Check if it's a submodule (only for __init__.py files)
         # Note: submodules may not be in the graph if not explicitly imported,
-        # so we check on disk and add them dynamically
+        # so we check on disk and load them dynamically
         if pkg_dir is not None:
             submodule_dir = pkg_dir / attr / "__init__.py"
             submodule_file_py = pkg_dir / f"{attr}.py"
 
             # Check for submodule directory (pkg/attr/__init__.py)
             if submodule_dir.exists():
-                # Add to graph if not present
-                if submodule_dir not in self.graph.nodes:
-                    self._add_module_to_graph(submodule_dir)
-                if submodule_dir in self.graph.nodes:
+                # Load it if not known yet
+                if not self._has_module(submodule_dir):
+                    self._add_attr_module(submodule_dir)
+                if self._has_module(submodule_dir):
                     return submodule_dir
 
             # Check for submodule file (pkg/attr.py)
             if submodule_file_py.exists():
-                # Add to graph if not present
-                if submodule_file_py not in self.graph.nodes:
-                    self._add_module_to_graph(submodule_file_py)
-                if submodule_file_py in self.graph.nodes:
+                # Load it if not known yet
+                if not self._has_module(submodule_file_py):
+                    self._add_attr_module(submodule_file_py)
+                if self._has_module(submodule_file_py):
                     return submodule_file_py
 
         # Check if attr is imported/re-exported in the module and is a module itself
@@ -798,20 +1171,22 @@ class CrossFileAnalyzer:
         for imp in module_info.imports:
             if imp.name == attr:
                 # Find where this import resolves to
-                for edge in self.graph.get_imports(module_path):
+                for edge in self._by_importer.get(module_path, ()):
                     if attr in edge.names and edge.imported:
                         # Check if the imported thing is itself a module
-                        if edge.imported in self.graph.nodes:
+                        if self._has_module(edge.imported):
                             return edge.imported
                         break
 
         return None
 
-    def _add_module_to_graph(self, file_path: Path) -> None:
-        """Add a module to the graph dynamically.
+    def _add_attr_module(self, file_path: Path) -> None:
+        """Load a module dynamically for attribute resolution.
 
         This is used when we discover submodules that weren't explicitly imported
-        but are accessed via attribute syntax (e.g., pkg.submod.attr).
+        but are accessed via attribute syntax (e.g., pkg.submod.attr). The
+        module and its edges are kept in _attr_modules and _by_importer, not
+        in the graph.
         """
         try:
             source = file_path.read_text(encoding="utf-8")
@@ -827,10 +1202,10 @@ class CrossFileAnalyzer:
         # Extract defined names
         def_collector = DefinitionCollector()
         def_collector.visit(tree)
-        defined_names = def_collector.defined_names
+        defined_names = sorted_names(def_collector.defined_names)
 
         # Extract __all__ if present
-        exports = collect_dunder_all_names(tree)
+        exports = sorted_names(collect_dunder_all_names(tree))
 
         # Create module info
         # Compute module name based on file path relative to graph root
@@ -851,7 +1226,7 @@ class CrossFileAnalyzer:
             defined_names=defined_names,
         )
 
-        self.graph.nodes[file_path] = module_info
+        self._attr_modules[file_path] = module_info
 
         # Also process imports and add edges
         # Use the entry point to create the resolver so it has the correct source root
@@ -862,11 +1237,11 @@ class CrossFileAnalyzer:
         for imp in imports:
             if imp.is_from_import:
                 module_name_to_resolve = imp.module
-                names = {imp.name}
+                names = frozenset((imp.name,))
                 level = imp.level
             else:
                 module_name_to_resolve = imp.original_name
-                names = {imp.name}
+                names = frozenset((imp.name,))
                 level = imp.level
 
             # Resolve the import
@@ -883,11 +1258,11 @@ class CrossFileAnalyzer:
                 is_external=is_external,
                 level=level,
             )
-            self.graph.add_edge(edge)
+            self._index_edge(edge)
 
-            # If resolved to a local file not in graph, add it recursively
-            if resolved and resolved not in self.graph.nodes:
-                self._add_module_to_graph(resolved)
+            # If resolved to a local file not known yet, load it recursively
+            if resolved and not self._has_module(resolved):
+                self._add_attr_module(resolved)
 
     def _find_import_lineno(
         self,
@@ -904,7 +1279,7 @@ class CrossFileAnalyzer:
         for imp in module.imports:
             if imp.name == name:
                 # Verify this import is from the right module
-                for edge in self.graph.get_imports(importer):
+                for edge in self._by_importer.get(importer, ()):
                     if edge.imported == imported and name in edge.names:
                         return imp.lineno
 
@@ -915,7 +1290,11 @@ def analyze_cross_file(
     graph: ImportGraph,
     entry_point: Path | None = None,
     include_same_package_indirect: bool = False,
+    jobs: int | None = 1,
+    cache_dir: Path | None = None,
 ) -> CrossFileResult:
     """Convenience function for cross-file analysis."""
-    analyzer = CrossFileAnalyzer(graph, entry_point, include_same_package_indirect)
+    analyzer = CrossFileAnalyzer(
+        graph, entry_point, include_same_package_indirect, jobs, cache_dir,
+    )
     return analyzer.analyze()
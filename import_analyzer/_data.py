@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+from bisect import bisect_left
+from collections.abc import Iterable
 from dataclasses import dataclass
 from dataclasses import field
 from pathlib import Path
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ImportInfo:
     """Information about an import statement."""
 
@@ -23,31 +25,62 @@ class ImportInfo:
     level: int = 0  # Number of dots for relative imports (0 = absolute)
 
 
-@dataclass
+def sorted_names(names: Iterable[str]) -> tuple[str, ...]:
+    """Build the sorted, de-duplicated name tuple stored on ModuleInfo."""
+    return tuple(sorted(set(names)))
+
+
+def _contains_name(names: tuple[str, ...], name: str) -> bool:
+    """Binary search for name in a sorted name tuple."""
+    i = bisect_left(names, name)
+    return i < len(names) and names[i] == name
+
+
+@dataclass(slots=True, frozen=True)
 class ModuleInfo:
-    """Information about a Python module in the project."""
+    """Information about a Python module in the project.
+
+    exports and defined_names are sorted tuples (see sorted_names()): most
+    modules only have a few dozen of them, and a tuple takes a fraction of the
+    memory of a set. Use is_exported() / has_defined() for lookups.
+    """
 
     file_path: Path
     module_name: str  # "mypackage.submodule.utils"
     is_package: bool  # True for __init__.py
     imports: list[ImportInfo] = field(default_factory=list)
-    exports: set[str] = field(default_factory=set)  # Names in __all__
-    defined_names: set[str] = field(default_factory=set)  # Classes, functions, vars
+    exports: tuple[str, ...] = ()  # Names in __all__
+    defined_names: tuple[str, ...] = ()  # Classes, functions, vars
+    # Names bound by this module's imports (derived from imports)
+    import_name_set: frozenset[str] = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "import_name_set", frozenset(imp.name for imp in self.imports),
+        )
 
-@dataclass
+    def is_exported(self, name: str) -> bool:
+        """Check if name is listed in this module's __all__."""
+        return _contains_name(self.exports, name)
+
+    def has_defined(self, name: str) -> bool:
+        """Check if name is defined (not imported) in this module."""
+        return _contains_name(self.defined_names, name)
+
+
+@dataclass(slots=True, frozen=True)
 class ImportEdge:
     """An edge in the import graph."""
 
     importer: Path  # File containing the import statement
     imported: Path | None  # Resolved file path, None = external module
     module_name: str  # The module name as written in the import
-    names: set[str]  # Names being imported (e.g., {"List", "Dict"})
+    names: frozenset[str]  # Names being imported (e.g., {"List", "Dict"})
     is_external: bool  # True if importing from stdlib/third-party
     level: int = 0  # Number of dots for relative imports
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ImplicitReexport:
     """Import used by other files but not in __all__."""
 
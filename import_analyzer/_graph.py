@@ -2,8 +2,11 @@
 from __future__ import annotations
 
 import ast
+import os
+import sys
 from collections import defaultdict
 from collections import deque
+from collections.abc import Iterator
 from pathlib import Path
 
 from import_analyzer._ast_helpers import ImportExtractor
@@ -11,6 +14,7 @@ from import_analyzer._ast_helpers import collect_dunder_all_names
 from import_analyzer._data import ImportEdge
 from import_analyzer._data import ImportInfo
 from import_analyzer._data import ModuleInfo
+from import_analyzer._data import sorted_names
 from import_analyzer._resolution import ModuleResolver
 
 # Directories to skip when scanning for Python files
@@ -33,21 +37,52 @@ _SKIP_DIRS = frozenset({
     ".mypy_cache",
     ".pytest_cache",
     ".ruff_cache",
+    ".import_analyzer_cache",
 })
 
 
+# Suffixes of glob patterns like *.egg-info
+_SKIP_DIR_SUFFIXES = tuple(
+    pattern[1:] for pattern in _SKIP_DIRS if pattern.startswith("*")
+)
+
+
+def _is_skipped_dir(name: str) -> bool:
+    """Check if a directory name is one of the skipped directories."""
+    return name in _SKIP_DIRS or name.endswith(_SKIP_DIR_SUFFIXES)
+
+
 def _should_skip_path(path: Path) -> bool:
     """Check if a path should be skipped during analysis."""
-    parts = path.parts
-    for skip_pattern in _SKIP_DIRS:
-        if skip_pattern.startswith("*"):
-            # Glob pattern like *.egg-info
-            suffix = skip_pattern[1:]
-            if any(part.endswith(suffix) for part in parts):
-                return True
-        elif skip_pattern in parts:
-            return True
-    return False
+    return any(_is_skipped_dir(part) for part in path.parts)
+
+
+def walk_python_files(directory: Path) -> Iterator[Path]:
+    """Yield all Python files under a directory, skipping non-source dirs.
+
+    Uses os.scandir, whose entries carry the file type from the directory
+    listing, so most entries need no extra stat call. Skipped directories
+    are pruned by name without being listed. Like Path.rglob(), symlinked
+    directories are not followed and files are yielded in pre-order.
+    """
+    pending = [os.fspath(directory)]
+    while pending:
+        files: list[Path] = []
+        subdirs: list[str] = []
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not _is_skipped_dir(entry.name):
+                            subdirs.append(entry.path)
+                    elif entry.name.endswith(".py") and entry.is_file():
+                        files.append(Path(entry.path))
+        except OSError:
+            continue
+
+        yield from files
+        # Reversed so the first subdirectory is popped (and walked) first
+        pending.extend(reversed(subdirs))
 
 
 class ImportGraph:
@@ -71,6 +106,16 @@ class ImportGraph:
         if edge.imported is not None:
             self._importers_by_file[edge.imported].append(edge)
 
+    def remove_imports(self, file: Path) -> None:
+        """Remove all import edges made by a file (e.g. before re-adding them)."""
+        removed = self._imports_by_file.pop(file, [])
+        if not removed:
+            return
+        self.edges = [edge for edge in self.edges if edge.importer != file]
+        for edge in removed:
+            if edge.imported is not None:
+                self._importers_by_file[edge.imported].remove(edge)
+
     def get_imports(self, file: Path) -> list[ImportEdge]:
         """Get all imports made by a file."""
         return self._imports_by_file.get(file, [])
@@ -79,56 +124,84 @@ class ImportGraph:
         """Get all files that import a given file."""
         return self._importers_by_file.get(file, [])
 
-    def find_cycles(self) -> list[list[Path]]:
-        """Find all import cycles using Tarjan's algorithm.
+    def strongly_connected_components(self) -> list[list[Path]]:
+        """Find all strongly connected components using Tarjan's algorithm.
 
-        Returns a list of strongly connected components with more than one node,
-        representing circular import chains.
+        The DFS uses an explicit stack, so long import chains can't hit the
+        recursion limit. Components are returned dependencies first: each
+        component comes after every component it imports from.
         """
-        index_counter = [0]
-        stack: list[Path] = []
-        lowlink: dict[Path, int] = {}
         index: dict[Path, int] = {}
+        lowlink: dict[Path, int] = {}
+        stack: list[Path] = []
         on_stack: set[Path] = set()
         sccs: list[list[Path]] = []
+        # DFS frames: (node, iterator over its remaining successors)
+        dfs_stack: list[tuple[Path, Iterator[Path]]] = []
+
+        def successors(node: Path) -> Iterator[Path]:
+            # Files we import (external imports have no file)
+            for edge in self._imports_by_file.get(node, []):
+                if edge.imported is not None:
+                    yield edge.imported
 
-        def strongconnect(node: Path) -> None:
-            index[node] = index_counter[0]
-            lowlink[node] = index_counter[0]
-            index_counter[0] += 1
+        def visit(node: Path) -> None:
+            index[node] = lowlink[node] = len(index)
             stack.append(node)
             on_stack.add(node)
+            dfs_stack.append((node, successors(node)))
 
-            # Consider successors (files we import)
-            for edge in self._imports_by_file.get(node, []):
-                if edge.imported is None:
-                    continue  # Skip external imports
-                successor = edge.imported
-                if successor not in index:
-                    strongconnect(successor)
-                    lowlink[node] = min(lowlink[node], lowlink[successor])
-                elif successor in on_stack:
-                    lowlink[node] = min(lowlink[node], index[successor])
-
-            # If node is root of SCC
-            if lowlink[node] == index[node]:
-                scc: list[Path] = []
-                while True:
-                    w = stack.pop()
-                    on_stack.remove(w)
-                    scc.append(w)
-                    if w == node:
-                        break
-                # Only keep SCCs with more than one node (actual cycles)
-                if len(scc) > 1:
-                    sccs.append(scc)
+        for root in self.nodes:
+            if root in index:
+                continue
+
+            visit(root)
 
-        for node in self.nodes:
-            if node not in index:
-                strongconnect(node)
+            while dfs_stack:
+                node, children = dfs_stack[-1]
+
+                for successor in children:
+                    if successor not in index:
+                        visit(successor)
+                        break
+                    if successor in on_stack:
+                        lowlink[node] = min(lowlink[node], index[successor])
+                else:
+                    # All successors done: propagate lowlink to the parent
+                    dfs_stack.pop()
+                    if dfs_stack:
+                        parent = dfs_stack[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+                    # If node is root of SCC
+                    if lowlink[node] == index[node]:
+                        scc: list[Path] = []
+                        while True:
+                            w = stack.pop()
+                            on_stack.remove(w)
+                            scc.append(w)
+                            if w == node:
+                                break
+                        sccs.append(scc)
 
         return sccs
 
+    def find_cycles(
+        self, sccs: list[list[Path]] | None = None,
+    ) -> list[list[Path]]:
+        """Find all import cycles.
+
+        Returns the strongly connected components with more than one node,
+        one entry per circular import chain. A file importing itself (e.g.
+        `from . import submodule` in a package's __init__.py) is not a cycle.
+
+        Args:
+            sccs: Already computed strongly_connected_components() to reuse
+        """
+        if sccs is None:
+            sccs = self.strongly_connected_components()
+        return [scc for scc in sccs if len(scc) > 1]
+
     def find_reachable_files(
         self,
         entry_point: Path,
@@ -220,21 +293,24 @@ class ImportGraph:
 
 
 class DefinitionCollector(ast.NodeVisitor):
-    """Collect names defined in a module (classes, functions, variables)."""
+    """Collect names defined in a module (classes, functions, variables).
+
+    Names are interned, like import names (see ImportExtractor).
+    """
 
     def __init__(self) -> None:
         self.defined_names: set[str] = set()
 
     def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
-        self.defined_names.add(node.name)
+        self.defined_names.add(sys.intern(node.name))
         # Don't recurse into function body
 
     def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
-        self.defined_names.add(node.name)
+        self.defined_names.add(sys.intern(node.name))
         # Don't recurse into function body
 
     def visit_ClassDef(self, node: ast.ClassDef) -> None:
-        self.defined_names.add(node.name)
+        self.defined_names.add(sys.intern(node.name))
         # Don't recurse into class body
 
     def visit_Assign(self, node: ast.Assign) -> None:
@@ -246,7 +322,7 @@ class DefinitionCollector(ast.NodeVisitor):
 
     def _collect_target_names(self, target: ast.expr) -> None:
         if isinstance(target, ast.Name):
-            self.defined_names.add(target.id)
+            self.defined_names.add(sys.intern(target.id))
         elif isinstance(target, (ast.Tuple, ast.List)):
             for elt in target.elts:
                 self._collect_target_names(elt)
@@ -275,9 +351,7 @@ class GraphBuilder:
         directory = directory.resolve()
 
         # Find all Python files, skipping common non-source directories
-        for py_file in directory.rglob("*.py"):
-            if _should_skip_path(py_file):
-                continue
+        for py_file in walk_python_files(directory):
             if py_file not in self._visited:
                 self._process_file(py_file)
 
@@ -322,8 +396,8 @@ class GraphBuilder:
             module_name=module_name,
             is_package=is_package,
             imports=import_extractor.imports,
-            exports=exports,
-            defined_names=def_collector.defined_names,
+            exports=sorted_names(exports),
+            defined_names=sorted_names(def_collector.defined_names),
         )
         self.graph.add_node(module_info)
 
@@ -355,7 +429,7 @@ class GraphBuilder:
                 importer=file_path,
                 imported=resolved,
                 module_name=module_name,
-                names=names,
+                names=frozenset(names),
                 is_external=is_external,
                 level=level,
             )
@@ -376,10 +450,6 @@ class GraphBuilder:
             ):
                 # Get names available from the __init__.py (imports + definitions)
                 init_module = self.graph.nodes.get(resolved)
-                init_names: set[str] = set()
-                if init_module:
-                    init_names = {imp.name for imp in init_module.imports}
-                    init_names |= init_module.defined_names
 
                 for name in names:
                     # Only check for submodule if name is NOT already available
@@ -387,7 +457,10 @@ class GraphBuilder:
                     # - `from pkg import Foo` where Foo is re-exported in __init__.py
                     # - `from pkg import submodule` where submodule is
                     #   a subpackage NOT imported in __init__.py
-                    if name in init_names:
+                    if init_module and (
+                        name in init_module.import_name_set
+                        or init_module.has_defined(name)
+                    ):
                         continue
 
                     submodule_name = f"{module_name}.{name}"
@@ -8,16 +8,17 @@ from pathlib import Path
 from import_analyzer._autofix import fix_indirect_attr_accesses
 from import_analyzer._autofix import fix_indirect_imports
 from import_analyzer._autofix import remove_unused_imports
-from import_analyzer._cross_file import analyze_cross_file
+from import_analyzer._cache import DEFAULT_CACHE_DIR
+from import_analyzer._cross_file import CrossFileAnalyzer
 from import_analyzer._data import ImportInfo
 from import_analyzer._data import IndirectAttributeAccess
 from import_analyzer._data import IndirectImport
 from import_analyzer._data import is_under_path
 from import_analyzer._detection import find_unused_imports
 from import_analyzer._format import format_cross_file_results
-from import_analyzer._graph import ImportGraph
 from import_analyzer._graph import build_import_graph
 from import_analyzer._graph import build_import_graph_from_directory
+from import_analyzer._graph import walk_python_files
 
 
 def check_file(filepath: Path, fix_unused: bool = False) -> tuple[int, list[str]]:
@@ -66,6 +67,8 @@ def check_cross_file(
     warn_unreachable: bool = False,
     strict_indirect_imports: bool = False,
     quiet: bool = False,
+    jobs: int | None = 1,
+    cache_dir: Path | None = None,
 ) -> tuple[int, list[str]]:
     """Check imports across files (cross-file mode).
 
@@ -78,6 +81,9 @@ def check_cross_file(
         warn_unreachable: Whether to warn about unreachable files
         strict_indirect_imports: Also flag same-package __init__.py re-exports
         quiet: Whether to suppress individual issue messages
+        jobs: Number of workers for per-file analysis
+            (None = one per CPU)
+        cache_dir: Directory for cached per-file results (None = no cache)
 
     Returns:
         Tuple of (number of issues found, list of messages)
@@ -92,11 +98,14 @@ def check_cross_file(
         # No single entry point for directory mode
 
     # Analyze (pass entry point for file reachability tracking)
-    result = analyze_cross_file(
+    analyzer = CrossFileAnalyzer(
         graph,
         entry_point,
         include_same_package_indirect=strict_indirect_imports,
+        jobs=jobs,
+        cache_dir=cache_dir,
     )
+    result = analyzer.analyze()
 
     # Fix indirect imports first (if requested)
     # This enables cascade: after fixing indirect imports, the re-exports become unused
@@ -105,7 +114,7 @@ def check_cross_file(
         indirect_fixed_files = _fix_indirect_imports(
             result.indirect_imports,
             result.indirect_attr_accesses,
-            graph,
+            analyzer.module_names(),
             path,
         )
 
@@ -180,7 +189,7 @@ def _fix_file_silent(
 def _fix_indirect_imports(
     indirect_imports: list[IndirectImport],
     indirect_attr_accesses: list[IndirectAttributeAccess],
-    graph: ImportGraph,
+    module_names: dict[Path, str],
     base_path: Path,
 ) -> dict[Path, int]:
     """Fix indirect imports by rewriting them to use direct sources.
@@ -188,7 +197,7 @@ def _fix_indirect_imports(
     Args:
         indirect_imports: List of indirect imports to fix
         indirect_attr_accesses: List of indirect attribute accesses to fix
-        graph: The import graph (for module name lookup)
+        module_names: Module name of each known file
         base_path: Base path for filtering (only fix files under this path)
 
     Returns:
@@ -211,11 +220,6 @@ def _fix_indirect_imports(
     if not filtered_indirect and not filtered_attr_accesses:
         return {}
 
-    # Build module name lookup from graph
-    module_names: dict[Path, str] = {}
-    for file_path, module_info in graph.nodes.items():
-        module_names[file_path] = module_info.module_name
-
     # Group indirect imports by file
     imports_by_file: dict[Path, list[IndirectImport]] = defaultdict(list)
     for ind in filtered_indirect:
@@ -264,7 +268,11 @@ def _fix_indirect_imports(
 
 
 def collect_python_files(paths: list[Path]) -> list[Path]:
-    """Collect all Python files from given paths."""
+    """Collect all Python files from given paths.
+
+    Directories are searched recursively, skipping non-source directories
+    like .venv, .git and __pycache__.
+    """
     files: list[Path] = []
 
     for path in paths:
@@ -272,7 +280,7 @@ def collect_python_files(paths: list[Path]) -> list[Path]:
             if path.suffix == ".py":
                 files.append(path)
         elif path.is_dir():
-            files.extend(path.rglob("*.py"))
+            files.extend(walk_python_files(path))
 
     return files
 
@@ -342,9 +350,24 @@ Examples:
         dest="fix_indirect",
         help="Rewrite indirect imports to use direct sources",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        help="Number of workers for analyzing files (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Don't read or write cached per-file results in {DEFAULT_CACHE_DIR}/",
+    )
 
     args = parser.parse_args()
 
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
     # Determine mode
     if args.single_file:
         return _main_single_file(args)
@@ -411,6 +434,8 @@ def _main_cross_file(args: argparse.Namespace) -> int:
         warn_unreachable=args.warn_unreachable,
         strict_indirect_imports=args.strict_indirect_imports,
         quiet=args.quiet,
+        jobs=args.jobs,
+        cache_dir=None if args.no_cache else DEFAULT_CACHE_DIR,
     )
 
     # The formatter already includes the summary, so just print all messages
@@ -0,0 +1,30 @@
+"""Optional mypyc build.
+
+Package metadata lives in pyproject.toml. This file only exists so the
+single-file analysis modules can be compiled with mypyc:
+
+    IMPORT_ANALYZER_USE_MYPYC=1 pip install --no-build-isolation .
+
+mypy (which ships mypyc) must be installed in the build environment. Without
+the environment variable the package is built as pure Python.
+"""
+from __future__ import annotations
+
+import os
+
+from setuptools import setup
+
+if os.environ.get("IMPORT_ANALYZER_USE_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(
+        [
+            "import_analyzer/_detection.py",
+            "import_analyzer/_autofix.py",
+        ],
+        opt_level="3",
+    )
+else:
+    ext_modules = []
+
+setup(ext_modules=ext_modules)
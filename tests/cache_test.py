@@ -0,0 +1,154 @@
+"""Tests for the on-disk result cache (_cache.py)."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+import import_analyzer._main
+from import_analyzer import _detection
+from import_analyzer._cache import DEFAULT_CACHE_DIR
+from import_analyzer._cache import _cache_salt
+from import_analyzer._cache import cache_get
+from import_analyzer._cache import cache_key
+from import_analyzer._cache import cache_put
+from import_analyzer._cross_file import analyze_cross_file
+from import_analyzer._data import ImportInfo
+from import_analyzer._graph import build_import_graph
+from import_analyzer._main import main
+
+_IMPORT = ImportInfo(
+    name="os",
+    module="",
+    original_name="os",
+    lineno=1,
+    col_offset=7,
+    end_lineno=1,
+    end_col_offset=9,
+    is_from_import=False,
+    full_node_lineno=1,
+    full_node_end_lineno=1,
+)
+
+# =============================================================================
+# cache_key / cache_get / cache_put tests
+# =============================================================================
+
+
+def test_cache_key_depends_on_content():
+    """Different contents should get different keys."""
+    assert cache_key(b"import os\n") == cache_key(b"import os\n")
+    assert cache_key(b"import os\n") != cache_key(b"import sys\n")
+
+
+def test_cache_key_depends_on_analyzer_source(tmp_path, monkeypatch):
+    """Editing the detection code should invalidate existing entries."""
+    before = cache_key(b"import os\n")
+
+    edited = tmp_path / "_detection.py"
+    edited.write_bytes(Path(_detection.__file__).read_bytes() + b"# edited\n")
+    monkeypatch.setattr(_detection, "__file__", str(edited))
+    _cache_salt.cache_clear()
+    try:
+        assert cache_key(b"import os\n") != before
+    finally:
+        monkeypatch.undo()
+        _cache_salt.cache_clear()
+    assert cache_key(b"import os\n") == before
+
+
+@pytest.mark.parametrize(
+    "unused",
+    [
+        pytest.param([_IMPORT], id="one import"),
+        pytest.param([], id="no imports"),
+    ],
+)
+def test_cache_roundtrip(tmp_path, unused):
+    """Stored results should be returned unchanged."""
+    key = cache_key(b"import os\n")
+    cache_put(tmp_path / "cache", key, unused)
+
+    assert cache_get(tmp_path / "cache", key) == unused
+
+
+def test_cache_miss(tmp_path):
+    """Unknown keys should be a cache miss."""
+    assert cache_get(tmp_path, cache_key(b"")) is None
+
+
+@pytest.mark.parametrize(
+    "contents",
+    [
+        pytest.param("not json", id="not json"),
+        pytest.param("[{}]", id="empty entry"),
+        pytest.param('[{"name": "x"}]', id="missing fields"),
+        pytest.param('[{"name": 1, "module": "", "original_name": "x"}]', id="wrong type"),
+        pytest.param("[1]", id="not an object"),
+    ],
+)
+def test_cache_corrupt_entry_is_miss(tmp_path, contents):
+    """Corrupt entries should be treated as a cache miss."""
+    key = cache_key(b"import os\n")
+    cache_put(tmp_path, key, [_IMPORT])
+    (tmp_path / key[:2] / key[2:]).write_text(contents)
+
+    assert cache_get(tmp_path, key) is None
+
+
+def test_cache_dir_is_gitignored(tmp_path):
+    """The cache directory should ignore itself in version control."""
+    cache_put(tmp_path / "cache", cache_key(b""), [])
+
+    assert (tmp_path / "cache" / ".gitignore").read_text() == "*\n"
+
+
+# =============================================================================
+# Cross-file analysis with cache tests
+# =============================================================================
+
+
+def test_analysis_uses_cached_results(tmp_path):
+    """A second run should reuse cached results for unchanged files."""
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "main.py").write_text("import os\n")
+    cache_dir = tmp_path / "cache"
+
+    graph = build_import_graph(project / "main.py")
+    first = analyze_cross_file(graph, cache_dir=cache_dir)
+
+    # Poison the cache entry to prove the second run reads it
+    key = cache_key((project / "main.py").read_bytes())
+    cache_put(cache_dir, key, [])
+
+    second = analyze_cross_file(graph, cache_dir=cache_dir)
+
+    assert [imp.name for imp in first.unused_imports[project / "main.py"]] == ["os"]
+    assert second.unused_imports == {}
+
+
+def test_main_no_cache(tmp_path, monkeypatch):
+    """--no-cache should not create the cache directory."""
+    (tmp_path / "main.py").write_text("import os\n")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sys, 'argv', ['prog', '--no-cache', 'main.py'])
+
+    main()
+
+    assert not (tmp_path / ".import_analyzer_cache").exists()
+
+
+def test_main_writes_cache(tmp_path, monkeypatch):
+    """Cross-file mode should cache results in the working directory."""
+    (tmp_path / "main.py").write_text("import os\n")
+    monkeypatch.chdir(tmp_path)
+    # conftest.py redirects the cache for every other test
+    monkeypatch.setattr(import_analyzer._main, "DEFAULT_CACHE_DIR", DEFAULT_CACHE_DIR)
+    monkeypatch.setattr(sys, 'argv', ['prog', 'main.py'])
+
+    main()
+
+    assert (tmp_path / ".import_analyzer_cache").is_dir()
@@ -200,6 +200,7 @@ def test_cli_subprocess(tmp_path):
 
     result = subprocess.run(
         [sys.executable, '-m', 'import_analyzer', str(test_file)],
+        cwd=tmp_path,
         capture_output=True,
         text=True,
         encoding='utf-8',
@@ -211,6 +212,18 @@ def test_cli_subprocess(tmp_path):
     assert "Unused import 'os'" in result.stdout
 
 
+def test_import_does_not_load_process_pool():
+    """Importing the package should not pay for multiprocessing up front."""
+    code = (
+        "import sys, import_analyzer\n"
+        "assert 'concurrent.futures.process' not in sys.modules\n"
+    )
+
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True)
+
+    assert result.returncode == 0, result.stderr
+
+
 # =============================================================================
 # Cross-file mode: check_cross_file function tests
 # =============================================================================
@@ -402,6 +415,33 @@ def test_main_cross_file_quiet(tmp_path, monkeypatch, capsys):
     assert "Found 1 unused import(s)" in captured.out
 
 
+def test_main_cross_file_jobs(tmp_path, monkeypatch, capsys):
+    """Test --jobs in cross-file mode."""
+    (tmp_path / "main.py").write_text("import utils\n")
+    (tmp_path / "utils.py").write_text("import os\n")
+
+    monkeypatch.setattr(sys, 'argv', ['prog', '--jobs', '2', str(tmp_path)])
+
+    result = main()
+
+    assert result == 1
+    captured = capsys.readouterr()
+    assert "Found 2 unused import(s)" in captured.out
+
+
+def test_main_cross_file_jobs_invalid(tmp_path, monkeypatch, capsys):
+    """--jobs must be a positive number."""
+    (tmp_path / "main.py").write_text("")
+
+    monkeypatch.setattr(sys, 'argv', ['prog', '--jobs', '0', str(tmp_path)])
+
+    with pytest.raises(SystemExit):
+        main()
+
+    captured = capsys.readouterr()
+    assert "--jobs must be at least 1" in captured.err
+
+
 # =============================================================================
 # Cross-file mode: edge cases
 # =============================================================================
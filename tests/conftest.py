@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+import pytest
+
+import import_analyzer._main
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(tmp_path_factory, monkeypatch):
+    """Keep main() from writing its result cache into the working tree."""
+    monkeypatch.setattr(
+        import_analyzer._main,
+        "DEFAULT_CACHE_DIR",
+        tmp_path_factory.mktemp("cache"),
+    )
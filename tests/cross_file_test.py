@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import concurrent.futures
+import sys
 import tempfile
 from pathlib import Path
 
 import pytest
 
+import import_analyzer._cross_file as cross_file
+from import_analyzer._cross_file import CrossFileAnalyzer
 from import_analyzer._cross_file import analyze_cross_file
+from import_analyzer._graph import ImportGraph
 from import_analyzer._graph import build_import_graph
 from import_analyzer._graph import build_import_graph_from_directory
 from import_analyzer._main import check_cross_file
@@ -63,6 +68,33 @@ def test_implicit_reexport_detected(project_with_reexport):
     assert project_with_reexport / "main.py" in reexport.used_by
 
 
+def test_external_usage_missing_module_not_inserted(project_with_reexport):
+    """Looking up an unused module should not add it to external_usage."""
+    graph = build_import_graph(project_with_reexport / "main.py")
+    result = analyze_cross_file(graph)
+
+    with pytest.raises(KeyError):
+        result.external_usage["collections"]
+    assert "collections" not in result.external_usage
+
+
+def test_implicit_reexport_used_by_all_importers(tmp_path):
+    """used_by should list every file importing the re-exported name."""
+    (tmp_path / "a.py").write_text("from utils import List\nx: List[int] = []\n")
+    (tmp_path / "b.py").write_text("from utils import List, Dict\ny: List[Dict] = []\n")
+    (tmp_path / "c.py").write_text("from utils import Dict\nz: Dict = {}\n")
+    (tmp_path / "utils.py").write_text("from typing import List, Dict\n")
+
+    graph = build_import_graph_from_directory(tmp_path)
+    result = analyze_cross_file(graph)
+
+    used_by = {
+        reexport.import_name: {path.name for path in reexport.used_by}
+        for reexport in result.implicit_reexports
+    }
+    assert used_by == {"List": {"a.py", "b.py"}, "Dict": {"b.py", "c.py"}}
+
+
 def test_external_usage_aggregated(project_with_reexport):
     """Should track which files use which external modules."""
     graph = build_import_graph(project_with_reexport / "main.py")
@@ -433,6 +465,91 @@ def test_dunder_all_protects_used_imports():
         assert not any(imp.name == "Foo" for imp in init_unused)
 
 
+@pytest.mark.parametrize("depth", [2, 5, 20])
+def test_cascade_deep_reexport_chain(tmp_path, depth):
+    """Removal should propagate through the whole re-export chain."""
+    (tmp_path / "main.py").write_text("from m0 import X  # unused!\n")
+    for i in range(depth):
+        (tmp_path / f"m{i}.py").write_text(f"from m{i + 1} import X\n")
+    (tmp_path / f"m{depth}.py").write_text("X = 1\n")
+
+    graph = build_import_graph(tmp_path / "main.py")
+    result = analyze_cross_file(graph, tmp_path / "main.py")
+
+    unused_files = {path.name for path in result.unused_imports}
+    assert unused_files == {"main.py"} | {f"m{i}.py" for i in range(depth)}
+
+
+def test_cascade_chain_evaluates_each_candidate_once(tmp_path, monkeypatch):
+    """Importers are checked before their sources, so no re-evaluation."""
+    depth = 20
+    (tmp_path / "main.py").write_text("from m0 import X  # unused!\n")
+    for i in range(depth):
+        (tmp_path / f"m{i}.py").write_text(f"from m{i + 1} import X\n")
+    (tmp_path / f"m{depth}.py").write_text("X = 1\n")
+
+    calls = []
+    original = CrossFileAnalyzer._is_reexported
+
+    def counting_is_reexported(self, file_path, name, *args):
+        calls.append((file_path, name))
+        return original(self, file_path, name, *args)
+
+    monkeypatch.setattr(CrossFileAnalyzer, "_is_reexported", counting_is_reexported)
+
+    graph = build_import_graph(tmp_path / "main.py")
+    # Discovery order must not matter: list the deepest modules first
+    graph.nodes = dict(reversed(graph.nodes.items()))
+    result = analyze_cross_file(graph, tmp_path / "main.py")
+
+    assert len(result.unused_imports) == depth + 1
+    assert len(calls) == depth + 1
+
+
+@pytest.mark.parametrize(
+    ("main_source", "expected_unused", "expected_unreachable"),
+    [
+        pytest.param(
+            "import helpers\nhelpers.run()\n", {}, set(), id="no candidates",
+        ),
+        pytest.param(
+            "import helpers\n", {"main.py": ["helpers"]}, {"helpers.py"},
+            id="single candidate",
+        ),
+        pytest.param(
+            "import helpers\nimport os\n", {"main.py": ["helpers", "os"]},
+            {"helpers.py"}, id="several candidates",
+        ),
+    ],
+)
+def test_analyze_computes_sccs_once(
+    tmp_path, monkeypatch, main_source, expected_unused, expected_unreachable,
+):
+    """The cascade and cycle detection should share one SCC pass."""
+    (tmp_path / "main.py").write_text(main_source)
+    (tmp_path / "helpers.py").write_text("def run(): pass\n")
+
+    calls = []
+    original = ImportGraph.strongly_connected_components
+
+    def counting_scc(self, *args, **kwargs):
+        calls.append(self)
+        return original(self, *args, **kwargs)
+
+    graph = build_import_graph(tmp_path / "main.py")
+    monkeypatch.setattr(ImportGraph, "strongly_connected_components", counting_scc)
+    result = analyze_cross_file(graph, tmp_path / "main.py")
+
+    unused = {
+        path.name: [imp.name for imp in imps]
+        for path, imps in result.unused_imports.items()
+    }
+    assert unused == expected_unused
+    assert {path.name for path in result.unreachable_files} == expected_unreachable
+    assert result.circular_imports == []
+    assert len(calls) == 1
+
+
 # =============================================================================
 # File reachability cascade tests
 # =============================================================================
@@ -2273,3 +2390,223 @@ def test_fix_indirect_attr_access_no_duplicate_imports():
         assert "extensions.db" in app_content
         assert "models.db" not in app_content or "import models" in app_content
         assert "providers.db" not in app_content or "import providers" in app_content
+
+
+# =============================================================================
+# Per-file analysis tests
+# =============================================================================
+
+
+@pytest.mark.parametrize("jobs", [1, 2, None])
+def test_parallel_analysis_matches_serial(tmp_path, jobs):
+    """Analysis results should not depend on the number of workers."""
+    (tmp_path / "main.py").write_text("from a import X\n")
+    (tmp_path / "a.py").write_text("from b import X\nimport os\n")
+    (tmp_path / "b.py").write_text("from c import X\nimport sys\n")
+    (tmp_path / "c.py").write_text("X = 1\n")
+
+    graph = build_import_graph(tmp_path / "main.py")
+    result = analyze_cross_file(graph, jobs=jobs)
+
+    unused = {
+        path.name: sorted(imp.name for imp in imps)
+        for path, imps in result.unused_imports.items()
+    }
+    assert unused == {
+        "main.py": ["X"],
+        "a.py": ["X", "os"],
+        "b.py": ["X", "sys"],
+    }
+
+
+@pytest.mark.parametrize(
+    ("gil_enabled", "expected"),
+    [
+        pytest.param(True, "ProcessPoolExecutor", id="gil enabled"),
+        pytest.param(False, "ThreadPoolExecutor", id="free-threaded"),
+    ],
+)
+def test_executor_depends_on_gil(monkeypatch, gil_enabled, expected):
+    """Free-threaded builds should analyze files on threads."""
+    monkeypatch.setattr(sys, "_is_gil_enabled", lambda: gil_enabled, raising=False)
+
+    analyzer = CrossFileAnalyzer(ImportGraph(), jobs=2)
+    with analyzer._make_executor() as executor:
+        assert type(executor).__name__ == expected
+
+
+@pytest.mark.parametrize(
+    ("platform", "expected"),
+    [
+        pytest.param("win32", 61, id="windows"),
+        pytest.param("linux", 100, id="linux"),
+    ],
+)
+def test_process_pool_workers_capped_on_windows(monkeypatch, platform, expected):
+    """Windows process pools can't have more than 61 workers."""
+    created = []
+    monkeypatch.setattr(sys, "_is_gil_enabled", lambda: True, raising=False)
+    monkeypatch.setattr(sys, "platform", platform)
+    monkeypatch.setattr(
+        concurrent.futures, "ProcessPoolExecutor",
+        lambda max_workers: created.append(max_workers),
+    )
+
+    CrossFileAnalyzer(ImportGraph(), jobs=100)._make_executor()
+
+    assert created == [expected]
+
+
+def test_crlf_line_endings(tmp_path):
+    """Files with Windows line endings should be analyzed normally."""
+    (tmp_path / "main.py").write_bytes(b"import os\r\nimport sys\r\nsys.exit()\r\n")
+
+    graph = build_import_graph(tmp_path / "main.py")
+    result = analyze_cross_file(graph)
+
+    unused = result.unused_imports[tmp_path / "main.py"]
+    assert [(imp.name, imp.lineno) for imp in unused] == [("os", 1)]
+
+
+def test_large_file_read_completely(tmp_path):
+    """Files larger than a single read chunk should be read completely."""
+    padding = "x = 1\n" * 20_000
+    (tmp_path / "main.py").write_text(padding + "import os\n")
+
+    graph = build_import_graph(tmp_path / "main.py")
+    result = analyze_cross_file(graph)
+
+    unused = result.unused_imports[tmp_path / "main.py"]
+    assert [(imp.name, imp.lineno) for imp in unused] == [("os", 20_001)]
+
+
+# =============================================================================
+# Analyzer reuse tests
+# =============================================================================
+
+
+def test_analyzer_reuses_per_file_results(tmp_path, monkeypatch):
+    """Repeated analyze() calls shouldn't re-analyze unchanged files."""
+    (tmp_path / "main.py").write_text("import os\nfrom utils import helper\nhelper()\n")
+    (tmp_path / "utils.py").write_text("import sys\ndef helper(): pass\n")
+
+    analyzed = []
+    original = cross_file._analyze_one
+
+    def counting_analyze_one(file_path, *args, **kwargs):
+        analyzed.append(file_path.name)
+        return original(file_path, *args, **kwargs)
+
+    monkeypatch.setattr(cross_file, "_analyze_one", counting_analyze_one)
+
+    analyzer = CrossFileAnalyzer(build_import_graph(tmp_path / "main.py"))
+    first = analyzer.analyze()
+    second = analyzer.analyze()
+
+    assert first == second
+    assert sorted(analyzed) == ["main.py", "utils.py"]
+
+
+def test_analyzer_repeated_analyze_with_attribute_resolution(tmp_path):
+    """Modules added to resolve pkg.sub.X shouldn't change later runs."""
+    main = tmp_path / "main.py"
+    pkg = tmp_path / "pkg"
+    pkg.mkdir()
+    main.write_text("import pkg\nprint(pkg.sub.LOGGER)\n")
+    (pkg / "__init__.py").write_text("")
+    (pkg / "sub.py").write_text("import os\nfrom pkg.core import LOGGER\n")
+    (pkg / "core.py").write_text("LOGGER = None\n")
+
+    graph = build_import_graph(main)
+    analyzer = CrossFileAnalyzer(graph, main)
+    first = analyzer.analyze()
+    # Attribute resolution loaded pkg/sub.py without adding it to the graph
+    assert pkg / "sub.py" not in graph.nodes
+    second = analyzer.analyze()
+
+    assert first.unused_imports == {}
+    assert [acc.attr_name for acc in first.indirect_attr_accesses] == ["LOGGER"]
+    assert first == second
+
+    # Invalidating it drops it; attribute resolution adds it back
+    analyzer.invalidate([pkg / "sub.py"])
+    assert analyzer.analyze() == first
+
+
+@pytest.mark.parametrize(
+    "dirty",
+    [
+        pytest.param(["main.py"], id="importer only"),
+        pytest.param(["main.py", "pkg/sub.py"], id="importer and submodule"),
+    ],
+)
+def test_analyzer_attribute_module_later_imported(tmp_path, dirty):
+    """A module loaded for attribute resolution can become a project file."""
+    main = tmp_path / "main.py"
+    pkg = tmp_path / "pkg"
+    pkg.mkdir()
+    main.write_text("import pkg\nprint(pkg.sub.LOGGER)\n")
+    (pkg / "__init__.py").write_text("")
+    (pkg / "sub.py").write_text("import os\nfrom pkg.core import LOGGER\n")
+    (pkg / "core.py").write_text("LOGGER = None\n")
+
+    graph = build_import_graph(main)
+    analyzer = CrossFileAnalyzer(graph, main)
+    analyzer.analyze()
+
+    # main now imports the submodule directly; update the graph to match
+    main.write_text("from pkg import sub\n")
+    new_graph = build_import_graph(main)
+    for file_path in new_graph.nodes:
+        graph.remove_imports(file_path)
+        graph.nodes[file_path] = new_graph.nodes[file_path]
+        for edge in new_graph.get_imports(file_path):
+            graph.add_edge(edge)
+    analyzer.invalidate([tmp_path / name for name in dirty])
+
+    result = analyzer.analyze()
+    assert pkg / "sub.py" in graph.nodes
+    assert result == analyze_cross_file(graph, main)
+    assert result == analyze_cross_file(build_import_graph(main), main)
+    assert {
+        file_path.name: [imp.name for imp in unused]
+        for file_path, unused in result.unused_imports.items()
+    } == {"main.py": ["sub"], "sub.py": ["os", "LOGGER"]}
+
+
+def test_analyzer_invalidate_reanalyzes_changed_file(tmp_path):
+    """invalidate() should pick up a file's new contents."""
+    main = tmp_path / "main.py"
+    main.write_text("import os\nos.getcwd()\n")
+
+    analyzer = CrossFileAnalyzer(build_import_graph(main))
+    assert analyzer.analyze().unused_imports == {}
+
+    main.write_text("import os\n")
+    # Memoized until invalidated
+    assert analyzer.analyze().unused_imports == {}
+
+    analyzer.invalidate([main])
+    unused = analyzer.analyze().unused_imports
+    assert [imp.name for imp in unused[main]] == ["os"]
+
+
+def test_analyzer_invalidate_reindexes_edges(tmp_path):
+    """invalidate() should re-read a file's edges from the graph."""
+    main = tmp_path / "main.py"
+    utils = tmp_path / "utils.py"
+    main.write_text("from utils import helper\nhelper()\n")
+    utils.write_text("from core import helper\n")
+    (tmp_path / "core.py").write_text("def helper(): pass\n")
+
+    graph = build_import_graph(main)
+    analyzer = CrossFileAnalyzer(graph)
+    # Used by main.py, so not unused in utils.py
+    assert utils not in analyzer.analyze().unused_imports
+
+    main.write_text("")
+    graph.remove_imports(main)
+    analyzer.invalidate([main])
+
+    unused = analyzer.analyze().unused_imports
+    assert [imp.name for imp in unused[utils]] == ["helper"]
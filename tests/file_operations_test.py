@@ -211,6 +211,38 @@ def test_collect_empty_directory(tmp_path):
     assert files == []
 
 
+@pytest.mark.parametrize(
+    'dirname',
+    [
+        pytest.param('.venv', id='virtualenv'),
+        pytest.param('__pycache__', id='pycache'),
+        pytest.param('node_modules', id='node_modules'),
+        pytest.param('pkg.egg-info', id='egg-info suffix'),
+    ],
+)
+def test_collect_skips_non_source_directories(tmp_path, dirname):
+    """Test that non-source directories are not searched."""
+    (tmp_path / 'main.py').write_text('import os\n')
+    skipped = tmp_path / dirname / 'nested'
+    skipped.mkdir(parents=True)
+    (skipped / 'skipped.py').write_text('import sys\n')
+
+    files = collect_python_files([tmp_path])
+
+    assert files == [tmp_path / 'main.py']
+
+
+def test_collect_ignores_directory_named_py(tmp_path):
+    """Test that a directory ending in .py is searched, not collected."""
+    odd_dir = tmp_path / 'odd.py'
+    odd_dir.mkdir()
+    (odd_dir / 'inner.py').write_text('import os\n')
+
+    files = collect_python_files([tmp_path])
+
+    assert files == [odd_dir / 'inner.py']
+
+
 def test_collect_nonexistent_skipped(tmp_path):
     """Test that non-.py files passed directly are skipped."""
     txt_file = tmp_path / 'test.txt'
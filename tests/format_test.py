@@ -42,23 +42,24 @@ def test_format_groups_by_file(tmp_path: Path) -> None:
     file1.touch()
     file2.touch()
 
-    result = CrossFileResult()
-    result.unused_imports = {
-        file1: [
-            ImportInfo(
-                name="os", module="", original_name="os",
-                lineno=1, col_offset=0, end_lineno=1, end_col_offset=9,
-                is_from_import=False, full_node_lineno=1, full_node_end_lineno=1,
-            ),
-        ],
-        file2: [
-            ImportInfo(
-                name="sys", module="", original_name="sys",
-                lineno=1, col_offset=0, end_lineno=1, end_col_offset=10,
-                is_from_import=False, full_node_lineno=1, full_node_end_lineno=1,
-            ),
-        ],
-    }
+    result = CrossFileResult(
+        unused_imports={
+            file1: [
+                ImportInfo(
+                    name="os", module="", original_name="os",
+                    lineno=1, col_offset=0, end_lineno=1, end_col_offset=9,
+                    is_from_import=False, full_node_lineno=1, full_node_end_lineno=1,
+                ),
+            ],
+            file2: [
+                ImportInfo(
+                    name="sys", module="", original_name="sys",
+                    lineno=1, col_offset=0, end_lineno=1, end_col_offset=10,
+                    is_from_import=False, full_node_lineno=1, full_node_end_lineno=1,
+                ),
+            ],
+        },
+    )
 
     lines = format_cross_file_results(
         result, base_path=base, fix_unused=False,
@@ -78,21 +79,22 @@ def test_format_groups_same_line_imports(tmp_path: Path) -> None:
     file1 = base / "module.py"
     file1.touch()
 
-    result = CrossFileResult()
-    result.unused_imports = {
-        file1: [
-            ImportInfo(
-                name="List", module="typing", original_name="List",
-                lineno=1, col_offset=0, end_lineno=1, end_col_offset=25,
-                is_from_import=True, full_node_lineno=1, full_node_end_lineno=1,
-            ),
-            ImportInfo(
-                name="Dict", module="typing", original_name="Dict",
-                lineno=1, col_offset=0, end_lineno=1, end_col_offset=25,
-                is_from_import=True, full_node_lineno=1, full_node_end_lineno=1,
-            ),
-        ],
-    }
+    result = CrossFileResult(
+        unused_imports={
+            file1: [
+                ImportInfo(
+                    name="List", module="typing", original_name="List",
+                    lineno=1, col_offset=0, end_lineno=1, end_col_offset=25,
+                    is_from_import=True, full_node_lineno=1, full_node_end_lineno=1,
+                ),
+                ImportInfo(
+                    name="Dict", module="typing", original_name="Dict",
+                    lineno=1, col_offset=0, end_lineno=1, end_col_offset=25,
+                    is_from_import=True, full_node_lineno=1, full_node_end_lineno=1,
+                ),
+            ],
+        },
+    )
 
     lines = format_cross_file_results(
         result, base_path=base, fix_unused=False,
@@ -114,14 +116,15 @@ def test_format_implicit_reexports_section(tmp_path: Path) -> None:
     utils_file.touch()
     main_file.touch()
 
-    result = CrossFileResult()
-    result.implicit_reexports = [
-        ImplicitReexport(
-            source_file=utils_file,
-            import_name="helper",
-            used_by={main_file},
-        ),
-    ]
+    result = CrossFileResult(
+        implicit_reexports=[
+            ImplicitReexport(
+                source_file=utils_file,
+                import_name="helper",
+                used_by={main_file},
+            ),
+        ],
+    )
 
     lines = format_cross_file_results(
         result, base_path=base,
@@ -143,8 +146,9 @@ def test_format_circular_imports_section(tmp_path: Path) -> None:
     file_a.touch()
     file_b.touch()
 
-    result = CrossFileResult()
-    result.circular_imports = [[file_a, file_b]]
+    result = CrossFileResult(
+        circular_imports=[[file_a, file_b]],
+    )
 
     lines = format_cross_file_results(
         result, base_path=base,
@@ -168,8 +172,9 @@ def test_format_long_cycle_abbreviated(tmp_path: Path) -> None:
         f.touch()
         cycle.append(f)
 
-    result = CrossFileResult()
-    result.circular_imports = [cycle]
+    result = CrossFileResult(
+        circular_imports=[cycle],
+    )
 
     lines = format_cross_file_results(
         result, base_path=base,
@@ -203,16 +208,17 @@ def test_format_summary_with_issues(tmp_path: Path) -> None:
     file1 = base / "a.py"
     file1.touch()
 
-    result = CrossFileResult()
-    result.unused_imports = {
-        file1: [
-            ImportInfo(
-                name="os", module="", original_name="os",
-                lineno=1, col_offset=0, end_lineno=1, end_col_offset=9,
-                is_from_import=False, full_node_lineno=1, full_node_end_lineno=1,
-            ),
-        ],
-    }
+    result = CrossFileResult(
+        unused_imports={
+            file1: [
+                ImportInfo(
+                    name="os", module="", original_name="os",
+                    lineno=1, col_offset=0, end_lineno=1, end_col_offset=9,
+                    is_from_import=False, full_node_lineno=1, full_node_end_lineno=1,
+                ),
+            ],
+        },
+    )
 
     lines = format_cross_file_results(
         result, base_path=base, fix_unused=False,
@@ -229,16 +235,17 @@ def test_format_quiet_mode_shows_only_summary(tmp_path: Path) -> None:
     file1 = base / "a.py"
     file1.touch()
 
-    result = CrossFileResult()
-    result.unused_imports = {
-        file1: [
-            ImportInfo(
-                name="os", module="", original_name="os",
-                lineno=1, col_offset=0, end_lineno=1, end_col_offset=9,
-                is_from_import=False, full_node_lineno=1, full_node_end_lineno=1,
-            ),
-        ],
-    }
+    result = CrossFileResult(
+        unused_imports={
+            file1: [
+                ImportInfo(
+                    name="os", module="", original_name="os",
+                    lineno=1, col_offset=0, end_lineno=1, end_col_offset=9,
+                    is_from_import=False, full_node_lineno=1, full_node_end_lineno=1,
+                ),
+            ],
+        },
+    )
 
     lines = format_cross_file_results(
         result, base_path=base, fix_unused=False, quiet=True,
@@ -257,16 +264,17 @@ def test_format_fixed_shows_fixed_count(tmp_path: Path) -> None:
     file1 = base / "a.py"
     file1.touch()
 
-    result = CrossFileResult()
-    result.unused_imports = {
-        file1: [
-            ImportInfo(
-                name="os", module="", original_name="os",
-                lineno=1, col_offset=0, end_lineno=1, end_col_offset=9,
-                is_from_import=False, full_node_lineno=1, full_node_end_lineno=1,
-            ),
-        ],
-    }
+    result = CrossFileResult(
+        unused_imports={
+            file1: [
+                ImportInfo(
+                    name="os", module="", original_name="os",
+                    lineno=1, col_offset=0, end_lineno=1, end_col_offset=9,
+                    is_from_import=False, full_node_lineno=1, full_node_end_lineno=1,
+                ),
+            ],
+        },
+    )
 
     lines = format_cross_file_results(
         result, base_path=base,
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import ast
+import sys
 import tempfile
 from pathlib import Path
 
@@ -44,7 +46,7 @@ def test_import_graph_add_and_get_edge():
         importer=importer,
         imported=imported,
         module_name="b",
-        names={"foo"},
+        names=frozenset({"foo"}),
         is_external=False,
     )
     graph.add_edge(edge)
@@ -54,6 +56,94 @@ def test_import_graph_add_and_get_edge():
     assert graph.get_importers(imported) == [edge]
 
 
+def test_import_graph_remove_imports():
+    """remove_imports should drop a file's edges from all indices."""
+    from import_analyzer._data import ImportEdge
+
+    graph = ImportGraph()
+    a, b, c = Path("/test/a.py"), Path("/test/b.py"), Path("/test/c.py")
+    a_to_b = ImportEdge(
+        importer=a, imported=b, module_name="b",
+        names=frozenset({"foo"}), is_external=False,
+    )
+    c_to_b = ImportEdge(
+        importer=c, imported=b, module_name="b",
+        names=frozenset({"foo"}), is_external=False,
+    )
+    graph.add_edge(a_to_b)
+    graph.add_edge(c_to_b)
+
+    graph.remove_imports(a)
+
+    assert graph.edges == [c_to_b]
+    assert graph.get_imports(a) == []
+    assert graph.get_importers(b) == [c_to_b]
+
+
+def test_import_edge_is_frozen():
+    """Edges are immutable and hashable."""
+    import dataclasses
+
+    from import_analyzer._data import ImportEdge
+
+    edge = ImportEdge(
+        importer=Path("/test/a.py"),
+        imported=Path("/test/b.py"),
+        module_name="b",
+        names=frozenset({"foo"}),
+        is_external=False,
+    )
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        edge.module_name = "c"  # type: ignore[misc]
+    assert {edge, dataclasses.replace(edge)} == {edge}
+
+
+def test_module_info_import_name_set():
+    """import_name_set should contain the bound names of all imports."""
+    from import_analyzer._ast_helpers import ImportExtractor
+    from import_analyzer._data import ModuleInfo
+
+    extractor = ImportExtractor()
+    extractor.visit(ast.parse("import os.path\nfrom typing import List as L\n"))
+    info = ModuleInfo(
+        file_path=Path("/test/module.py"),
+        module_name="module",
+        is_package=False,
+        imports=extractor.imports,
+    )
+
+    assert info.import_name_set == frozenset({"os", "L"})
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        pytest.param("bar", True, id="first"),
+        pytest.param("foo", True, id="last"),
+        pytest.param("baz", False, id="between"),
+        pytest.param("zzz", False, id="after all"),
+        pytest.param("aaa", False, id="before all"),
+    ],
+)
+def test_module_info_name_lookups(name, expected):
+    """has_defined/is_exported should find names in the sorted tuples."""
+    from import_analyzer._data import ModuleInfo
+    from import_analyzer._data import sorted_names
+
+    info = ModuleInfo(
+        file_path=Path("/test/module.py"),
+        module_name="module",
+        is_package=False,
+        exports=sorted_names({"foo", "bar"}),
+        defined_names=sorted_names(["foo", "bar", "foo"]),
+    )
+
+    assert info.defined_names == ("bar", "foo")
+    assert info.has_defined(name) is expected
+    assert info.is_exported(name) is expected
+
+
 def test_import_graph_get_imports_empty():
     """Should return empty list for unknown files."""
     graph = ImportGraph()
@@ -110,6 +200,56 @@ def test_no_cycles():
         assert cycles == []
 
 
+def _chain_graph(names, cycle=False):
+    """Build an in-memory graph where each module imports the next one."""
+    from import_analyzer._data import ImportEdge
+    from import_analyzer._data import ModuleInfo
+
+    graph = ImportGraph()
+    paths = [Path(f"/test/{name}.py") for name in names]
+    for path in paths:
+        graph.add_node(ModuleInfo(file_path=path, module_name=path.stem, is_package=False))
+    targets = paths[1:] + (paths[:1] if cycle else [])
+    for importer, imported in zip(paths, targets):
+        graph.add_edge(
+            ImportEdge(
+                importer=importer,
+                imported=imported,
+                module_name=imported.stem,
+                names=frozenset({"x"}),
+                is_external=False,
+            ),
+        )
+    return graph, paths
+
+
+def test_strongly_connected_components_dependencies_first():
+    """Components should come after the components they import."""
+    graph, paths = _chain_graph(["a", "b", "c"])
+
+    sccs = graph.strongly_connected_components()
+
+    assert sccs == [[paths[2]], [paths[1]], [paths[0]]]
+
+
+def test_detect_long_cycle():
+    """Cycles longer than the recursion limit should be detected."""
+    names = [f"m{i}" for i in range(sys.getrecursionlimit() + 100)]
+    graph, paths = _chain_graph(names, cycle=True)
+
+    cycles = graph.find_cycles()
+
+    assert len(cycles) == 1
+    assert set(cycles[0]) == set(paths)
+
+
+def test_self_import_not_a_cycle():
+    """A module importing itself is not reported as a cycle."""
+    graph, paths = _chain_graph(["pkg"], cycle=True)
+
+    assert graph.find_cycles() == []
+
+
 # =============================================================================
 # Topological order tests
 # =============================================================================
@@ -272,7 +412,7 @@ def test_all_exports_detected():
         graph = build_import_graph(root / "module.py")
         module_info = graph.nodes[root / "module.py"]
 
-        assert module_info.exports == {"foo", "bar"}
+        assert module_info.exports == ("bar", "foo")
 
 
 def test_no_all_empty_exports():
@@ -285,7 +425,7 @@ def test_no_all_empty_exports():
         graph = build_import_graph(root / "module.py")
         module_info = graph.nodes[root / "module.py"]
 
-        assert module_info.exports == set()
+        assert module_info.exports == ()
 
 
 # =============================================================================
@@ -336,3 +476,25 @@ def test_variable_names_detected():
         assert "y" in module_info.defined_names
         assert "a" in module_info.defined_names
         assert "b" in module_info.defined_names
+
+
+def test_module_info_names_interned(tmp_path):
+    """Import, export and defined names should be interned strings."""
+    (tmp_path / "module.py").write_text(
+        "import os.path\n"
+        "from typing import List as L\n"
+        "__all__ = ['exported_name']\n"
+        "exported_name = 1\n",
+    )
+
+    graph = build_import_graph(tmp_path / "module.py")
+    module_info = graph.nodes[tmp_path / "module.py"]
+
+    names = (
+        [imp.name for imp in module_info.imports]
+        + list(module_info.exports)
+        + list(module_info.defined_names)
+    )
+    assert names
+    for name in names:
+        assert name is sys.intern(name)